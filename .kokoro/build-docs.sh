@@ -7,8 +7,10 @@ pwd
 ls
 env
 
-# Kokoro currently uses 3.6.1
-pyenv global 3.6.1
+# Disable buffering, so that the logs stream through.
+export PYTHONUNBUFFERED=1
+
+export PATH="${HOME}/.local/bin:${PATH}"
 
 # Kokoro exposes this as a file, but the scripts expect just a plain variable.
 export GITHUB_TOKEN=$(cat ${KOKORO_GFILE_DIR}/${GITHUB_TOKEN_FILE})
@@ -22,8 +24,10 @@ eval `ssh-agent -s`
 chmod 600 ${KOKORO_GFILE_DIR}/id_rsa
 ssh-add ${KOKORO_GFILE_DIR}/id_rsa
 
-# Install Requirements
-pip install --upgrade -r docs/requirements.txt
+# Install nox
+python3 -m pip install --user --upgrade --quiet nox
+python3 -m nox --version
 
-# Build and Publish Documentation
-bash scripts/build_docs.sh kokoro
+# Build Documentation (on the Python version testing/constraints-docs.txt
+# was compiled for)
+python3 -m nox -s docs
@@ -24,6 +24,13 @@ cd "${PROJECT_ROOT}"
 # Disable buffering, so that the logs stream through.
 export PYTHONUNBUFFERED=1
 
+# Collect coverage in the unit sessions for the ``cover`` session.
+export NOX_COVERAGE=1
+# Run the unit tests against every supported Python version.
+export FULL_MATRIX=1
+# Always run ``pip install`` rather than trusting cached installs.
+export NOX_SKIP_INSTALL_CACHE=1
+
 # Debug: show build environment
 env | grep KOKORO
 
@@ -51,9 +58,9 @@ if [[ $KOKORO_BUILD_ARTIFACTS_SUBDIR = *"continuous"* ]]; then
 fi
 
 # If NOX_SESSION is set, it only runs the specified session,
-# otherwise run all the sessions.
+# otherwise run all the sessions. (Bare ``nox`` only runs the unit tests.)
 if [[ -n "${NOX_SESSION:-}" ]]; then
     python3 -m nox -s ${NOX_SESSION:-}
 else
-    python3 -m nox
+    python3 -m nox -s unit unit_2 docs docfx doctest lint lint_setup_py system cover
 fi
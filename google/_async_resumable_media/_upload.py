@@ -22,10 +22,9 @@ Supported here are:
 """
 
 
+import binascii
 import json
 import os
-import random
-import sys
 
 import six
 from six.moves import http_client
@@ -42,7 +41,9 @@ from google.resumable_media._upload import (
     _CONTENT_RANGE_TEMPLATE,
     _RANGE_UNKNOWN_TEMPLATE,
     _EMPTY_RANGE_TEMPLATE,
-    _BOUNDARY_FORMAT,
+    _BOUNDARY_NUM_BYTES,
+    _BOUNDARY_PREFIX,
+    _BOUNDARY_SUFFIX,
     _MULTIPART_SEP,
     _CRLF,
     _MULTIPART_BEGIN,
@@ -827,11 +828,13 @@ def get_boundary():
     Returns:
         bytes: The boundary used to separate parts of a multipart request.
     """
-    random_int = random.randrange(sys.maxsize)
-    boundary = _BOUNDARY_FORMAT.format(random_int)
-    # NOTE: Neither % formatting nor .format() are available for byte strings
-    #       in Python 3.4, so we must use unicode strings as templates.
-    return boundary.encode(u"utf-8")
+    # NOTE: ``os.urandom`` is unpredictable (unlike ``random``), so a payload
+    #       cannot be crafted to contain the boundary, and with 128 random
+    #       bits an accidental match is negligible. That is why the payload
+    #       is never scanned for the boundary. Hex digits are valid boundary
+    #       characters per RFC 2046.
+    random_hex = binascii.hexlify(os.urandom(_BOUNDARY_NUM_BYTES))
+    return _BOUNDARY_PREFIX + random_hex + _BOUNDARY_SUFFIX
 
 
 def construct_multipart_request(data, metadata, content_type):
@@ -855,21 +858,25 @@ def construct_multipart_request(data, metadata, content_type):
     # Combine the two parts into a multipart payload.
     # NOTE: We'd prefer a bytes template but are restricted by Python 3.4.
     boundary_sep = _MULTIPART_SEP + multipart_boundary
-    content = (
-        boundary_sep
-        + _MULTIPART_BEGIN
-        + json_bytes
-        + _CRLF
-        + boundary_sep
-        + _CRLF
-        + b"content-type: "
-        + content_type
-        + _CRLF
-        + _CRLF
-        + data  # Empty line between headers and body.
-        + _CRLF
-        + boundary_sep
-        + _MULTIPART_SEP
+    # NOTE: ``join`` copies ``data`` into the payload once, whereas chained
+    #       ``+`` re-copies it for every piece that follows it.
+    content = b"".join(
+        (
+            boundary_sep,
+            _MULTIPART_BEGIN,
+            json_bytes,
+            _CRLF,
+            boundary_sep,
+            _CRLF,
+            b"content-type: ",
+            content_type,
+            _CRLF,
+            _CRLF,  # Empty line between headers and body.
+            data,
+            _CRLF,
+            boundary_sep,
+            _MULTIPART_SEP,
+        )
     )
 
     return content, multipart_boundary
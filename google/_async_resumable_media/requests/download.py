@@ -82,13 +82,19 @@ class Download(_request_helpers.RequestsMixin, _download.Download):
             response, self._get_headers, self.media_url, checksum_type=self.checksum
         )
 
-        local_checksum_object = _add_decoder(response, checksum_object)
+        # NOTE: Bind the per-chunk methods once, outside of the loop.
+        write = self._stream.write
+        update = None
+        if expected_checksum is not None:
+            # Without a checksum to verify, the decoder is left alone.
+            update = _add_decoder(response, checksum_object).update
 
         async for chunk in response.content.iter_chunked(
             _request_helpers._SINGLE_GET_CHUNK_SIZE
         ):
-            self._stream.write(chunk)
-            local_checksum_object.update(chunk)
+            write(chunk)
+            if update is not None:
+                update(chunk)
 
         if expected_checksum is None:
             return
@@ -210,11 +216,18 @@ class RawDownload(_request_helpers.RawRequestsMixin, _download.Download):
             response, self._get_headers, self.media_url, checksum_type=self.checksum
         )
 
+        # NOTE: Bind the per-chunk methods once, outside of the loop.
+        write = self._stream.write
+        update = None
+        if expected_checksum is not None:
+            update = checksum_object.update
+
         async for chunk in response.content.iter_chunked(
             _request_helpers._SINGLE_GET_CHUNK_SIZE
         ):
-            self._stream.write(chunk)
-            checksum_object.update(chunk)
+            write(chunk)
+            if update is not None:
+                update(chunk)
 
         if expected_checksum is None:
             return
@@ -18,6 +18,7 @@ Also supported here are simple (media) uploads and multipart
 uploads that contain both metadata and a small file as payload.
 """
 
+import asyncio
 
 from google._async_resumable_media import _upload
 from google._async_resumable_media.requests import _request_helpers
@@ -471,7 +472,13 @@ class ResumableUpload(_request_helpers.RequestsMixin, _upload.ResumableUpload):
                 chunk, a checksum validation was requested, and the checksum
                 does not match or is not available.
         """
-        method, url, payload, headers = self._prepare_request()
+        # NOTE: Reading the chunk (and updating the checksum) can block on
+        #       file-backed streams, so it runs in the default executor to
+        #       keep the event loop free while the data is read.
+        loop = asyncio.get_event_loop()
+        method, url, payload, headers = await loop.run_in_executor(
+            None, self._prepare_request
+        )
         response = await _request_helpers.http_request(
             transport,
             method,
@@ -22,11 +22,10 @@ Supported here are:
 """
 
 
+import binascii
 import json
 import os
-import random
 import re
-import sys
 
 import six
 from six.moves import http_client
@@ -40,8 +39,9 @@ _CONTENT_TYPE_HEADER = u"content-type"
 _CONTENT_RANGE_TEMPLATE = u"bytes {:d}-{:d}/{:d}"
 _RANGE_UNKNOWN_TEMPLATE = u"bytes {:d}-{:d}/*"
 _EMPTY_RANGE_TEMPLATE = u"bytes */{:d}"
-_BOUNDARY_WIDTH = len(str(sys.maxsize - 1))
-_BOUNDARY_FORMAT = u"==============={{:0{:d}d}}==".format(_BOUNDARY_WIDTH)
+_BOUNDARY_NUM_BYTES = 16
+_BOUNDARY_PREFIX = b"==============="
+_BOUNDARY_SUFFIX = b"=="
 _MULTIPART_SEP = b"--"
 _CRLF = b"\r\n"
 _MULTIPART_BEGIN = b"\r\ncontent-type: application/json; charset=UTF-8\r\n\r\n"
@@ -864,11 +864,13 @@ def get_boundary():
     Returns:
         bytes: The boundary used to separate parts of a multipart request.
     """
-    random_int = random.randrange(sys.maxsize)
-    boundary = _BOUNDARY_FORMAT.format(random_int)
-    # NOTE: Neither % formatting nor .format() are available for byte strings
-    #       in Python 3.4, so we must use unicode strings as templates.
-    return boundary.encode(u"utf-8")
+    # NOTE: ``os.urandom`` is unpredictable (unlike ``random``), so a payload
+    #       cannot be crafted to contain the boundary, and with 128 random
+    #       bits an accidental match is negligible. That is why the payload
+    #       is never scanned for the boundary. Hex digits are valid boundary
+    #       characters per RFC 2046.
+    random_hex = binascii.hexlify(os.urandom(_BOUNDARY_NUM_BYTES))
+    return _BOUNDARY_PREFIX + random_hex + _BOUNDARY_SUFFIX
 
 
 def construct_multipart_request(data, metadata, content_type):
@@ -892,21 +894,25 @@ def construct_multipart_request(data, metadata, content_type):
     # Combine the two parts into a multipart payload.
     # NOTE: We'd prefer a bytes template but are restricted by Python 3.4.
     boundary_sep = _MULTIPART_SEP + multipart_boundary
-    content = (
-        boundary_sep
-        + _MULTIPART_BEGIN
-        + json_bytes
-        + _CRLF
-        + boundary_sep
-        + _CRLF
-        + b"content-type: "
-        + content_type
-        + _CRLF
-        + _CRLF
-        + data  # Empty line between headers and body.
-        + _CRLF
-        + boundary_sep
-        + _MULTIPART_SEP
+    # NOTE: ``join`` copies ``data`` into the payload once, whereas chained
+    #       ``+`` re-copies it for every piece that follows it.
+    content = b"".join(
+        (
+            boundary_sep,
+            _MULTIPART_BEGIN,
+            json_bytes,
+            _CRLF,
+            boundary_sep,
+            _CRLF,
+            b"content-type: ",
+            content_type,
+            _CRLF,
+            _CRLF,  # Empty line between headers and body.
+            data,
+            _CRLF,
+            boundary_sep,
+            _MULTIPART_SEP,
+        )
     )
 
     return content, multipart_boundary
@@ -25,7 +25,10 @@ from google.resumable_media import common
 
 
 _DEFAULT_RETRY_STRATEGY = common.RetryStrategy()
-_SINGLE_GET_CHUNK_SIZE = 8192
+# Read response bodies in large chunks: checksum objects buffer partial
+# blocks internally, so fewer, larger ``update()`` / ``write()`` calls only
+# cut down on per-chunk Python overhead.
+_SINGLE_GET_CHUNK_SIZE = 1024 * 1024  # 1MB
 # The number of seconds to wait to establish a connection
 # (connect() call on socket). Avoid setting this to a multiple of 3 to not
 # Align with TCP Retransmission timing. (typically 2.5-3s)
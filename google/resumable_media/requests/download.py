@@ -94,17 +94,24 @@ class Download(_request_helpers.RequestsMixin, _download.Download):
         )
 
         with response:
-            # NOTE: In order to handle compressed streams gracefully, we try
-            # to insert our checksum object into the decompression stream. If
-            # the stream is indeed compressed, this will delegate the checksum
-            # object to the decoder and return a _DoNothingHash here.
-            local_checksum_object = _add_decoder(response.raw, checksum_object)
+            # NOTE: Bind the per-chunk methods once, outside of the loop.
+            write = self._stream.write
+            update = None
+            if expected_checksum is not None:
+                # NOTE: In order to handle compressed streams gracefully, we
+                # try to insert our checksum object into the decompression
+                # stream. If the stream is indeed compressed, this will
+                # delegate the checksum object to the decoder and return a
+                # _DoNothingHash here. Without a checksum to verify, the
+                # decoder is left alone.
+                update = _add_decoder(response.raw, checksum_object).update
             body_iter = response.iter_content(
                 chunk_size=_request_helpers._SINGLE_GET_CHUNK_SIZE, decode_unicode=False
             )
             for chunk in body_iter:
-                self._stream.write(chunk)
-                local_checksum_object.update(chunk)
+                write(chunk)
+                if update is not None:
+                    update(chunk)
 
         if expected_checksum is None:
             return
@@ -229,12 +236,18 @@ class RawDownload(_request_helpers.RawRequestsMixin, _download.Download):
         )
 
         with response:
+            # NOTE: Bind the per-chunk methods once, outside of the loop.
+            write = self._stream.write
+            update = None
+            if expected_checksum is not None:
+                update = checksum_object.update
             body_iter = response.raw.stream(
                 _request_helpers._SINGLE_GET_CHUNK_SIZE, decode_content=False
             )
             for chunk in body_iter:
-                self._stream.write(chunk)
-                checksum_object.update(chunk)
+                write(chunk)
+                if update is not None:
+                    update(chunk)
             response._content_consumed = True
 
         if expected_checksum is None:
@@ -13,53 +13,264 @@
 # limitations under the License.
 
 from __future__ import absolute_import
+import glob
+import json
 import os
 import pathlib
 import shutil
+import sys
 
 import nox
 
 CURRENT_DIRECTORY = pathlib.Path(__file__).parent.absolute()
 
 SYSTEM_TEST_ENV_VARS = ("GOOGLE_APPLICATION_CREDENTIALS",)
-BLACK_VERSION = "black==20.8b1"
 GOOGLE_AUTH = "google-auth >= 1.22.0, < 2.0dev"
+# Editable installs use ``--no-build-isolation``, building with these
+# (installed into the session's virtualenv first) instead of provisioning
+# a throwaway build environment on every install.
+BUILD_DEPS = ("setuptools", "wheel")
+EDITABLE = ("--no-build-isolation", "-e", ".")
+EDITABLE_REQUESTS = ("--no-build-isolation", "-e", ".[requests]")
+EDITABLE_ALL = ("--no-build-isolation", "-e", ".[requests,aiohttp]")
+# Test dependencies shared by sessions, spelled (and ordered) the same way
+# everywhere so ``cached_install`` sees identical requirements.
+UNIT_DEPS = ("mock", "pytest", "pytest-cov") + BUILD_DEPS
+ASYNC_DEPS = ("pytest-asyncio<=0.14.0",)
+SYSTEM_DEPS = ("mock", "pytest", GOOGLE_AUTH, "google-cloud-testutils") + BUILD_DEPS
+DOCS_DEPS = ("sphinx==4.0.1", "alabaster", "recommonmark")
+DOCS_CONSTRAINTS = str(CURRENT_DIRECTORY / "testing" / "constraints-docs.txt")
+CONSTRAINTS_TEMPLATE = str(CURRENT_DIRECTORY / "testing" / "constraints-{}.txt")
+
+UNIT_TESTS = os.path.join("tests", "unit")
+ASYNC_UNIT_TESTS = os.path.join("tests_async", "unit")
+SYSTEM_TESTS = os.path.join("tests", "system")
+ASYNC_SYSTEM_TESTS = os.path.join("tests_async", "system")
+DOCS_SOURCE = os.path.join("docs", "")
+DOCS_BUILD = os.path.join("docs", "_build")
 
 DEFAULT_PYTHON_VERSION = "3.8"
 SYSTEM_TEST_PYTHON_VERSIONS = ["2.7", "3.8"]
-UNIT_TEST_PYTHON_VERSIONS = ["3.6", "3.7", "3.8", "3.9"]
+# Locally, only the oldest and newest Python 3 versions are tested; set
+# ``FULL_MATRIX=1`` (as CI does) to run every supported version.
+if os.environ.get("FULL_MATRIX"):
+    UNIT_TEST_PYTHON_VERSIONS = ["3.6", "3.7", "3.8", "3.9"]
+else:
+    UNIT_TEST_PYTHON_VERSIONS = ["3.6", "3.9"]
 UNIT_TEST_SYNC_PYTHON_VERSIONS = ["2.7"]
 
+# Running bare ``nox`` only runs the unit tests (including the Python 2.7
+# ``unit_2`` session); request other sessions explicitly, e.g.
+# ``nox -s lint docs``.
+nox.options.sessions = ["unit", "unit_2"]
+# Behave as if ``-r`` was passed; use ``--no-reuse-existing-virtualenvs``
+# (``-N``) to force fresh virtualenvs.
+nox.options.reuse_existing_virtualenvs = True
+
+# Files whose modification invalidates every cached install. Set
+# ``NOX_SKIP_INSTALL_CACHE=1`` (as CI does) to always run ``pip install``.
+INSTALL_CACHE_FILE = ".nox_install_cache"
+INSTALL_CACHE_INPUTS = ("setup.py", "setup.cfg", "testing/constraints-*.txt")
+# When only the package metadata (not a constraints file) changed, editable
+# installs are refreshed with ``--no-deps`` and verified with ``pip check``
+# instead of going through pip's resolver again.
+CONSTRAINTS_INPUTS = ("testing/constraints-*.txt",)
+# Shared by every session so wheels are only downloaded / built once. CI
+# can persist this directory between builds; ``PIP_CACHE_DIR`` overrides it.
+PIP_CACHE_DIR = str(CURRENT_DIRECTORY / ".pip-cache")
+# Per-interpreter virtualenvs used to seed the ``unit`` sessions.
+TEMPLATE_DIRECTORY = CURRENT_DIRECTORY / ".nox-template"
+TEMPLATE_STAMP_FILE = ".nox_template_stamp"
+TEMPLATE_PTH_FILE = "_nox_template.pth"
+# Overrides ``pytest -n auto`` in the ``unit`` session; ``parallel`` sets it
+# to 1 so concurrent sessions don't each start one worker per core.
+XDIST_WORKERS_ENV = "NOX_PYTEST_WORKERS"
+PURELIB_SCRIPT = "import sysconfig; print(sysconfig.get_paths()['purelib'])"
+
+
+def _install_inputs_mtime(patterns=INSTALL_CACHE_INPUTS):
+    mtimes = [0.0]
+    for pattern in patterns:
+        for path in glob.glob(str(CURRENT_DIRECTORY / pattern)):
+            mtimes.append(os.path.getmtime(path))
+    return max(mtimes)
+
+
+def _load_json(path, default):
+    try:
+        with open(path) as file_obj:
+            return json.load(file_obj)
+    except (IOError, ValueError):
+        return default
+
+
+def _dump_json(path, value):
+    with open(path, "w") as file_obj:
+        json.dump(value, file_obj)
+
+
+def cached_install(session, *args):
+    """Run ``session.install(*args)`` unless it already ran in this venv.
+
+    Installs are recorded in a JSON file inside the session's virtualenv,
+    so a reused virtualenv (``nox -r``) skips pip entirely until one of
+    ``INSTALL_CACHE_INPUTS`` changes. If that change is only to ``setup.py``
+    or ``setup.cfg``, an editable (``-e``) install is redone without
+    resolving dependencies, falling back to a full install if ``pip check``
+    reports a broken environment.
+    """
+    if "PIP_CACHE_DIR" not in os.environ:
+        session.env["PIP_CACHE_DIR"] = PIP_CACHE_DIR
+
+    location = getattr(session.virtualenv, "location", None)
+    if os.environ.get("NOX_SKIP_INSTALL_CACHE") or location is None:
+        session.install(*args)
+        return
+
+    cache_path = os.path.join(location, INSTALL_CACHE_FILE)
+    cache = _load_json(cache_path, {})
+    key = json.dumps(list(args))
+    cached_mtime = cache.get(key, -1.0)
+    if cached_mtime >= _install_inputs_mtime():
+        session.log("Skipping cached install: {}".format(" ".join(args)))
+        return
+
+    if "-e" in args and cached_mtime >= _install_inputs_mtime(CONSTRAINTS_INPUTS):
+        session.install("--no-deps", *args)
+        try:
+            session.run("python", "-m", "pip", "check", silent=True)
+        except nox.command.CommandFailed:
+            session.install(*args)
+    else:
+        session.install(*args)
+    cache[key] = _install_inputs_mtime()
+    _dump_json(cache_path, cache)
+
+
+def _purelib(session, python):
+    output = session.run(python, "-c", PURELIB_SCRIPT, silent=True, external=True)
+    return output.strip()
+
+
+def install_from_template(session, *installs):
+    """Populate the session's virtualenv from a per-interpreter template.
+
+    Each of ``installs`` is a tuple of ``pip install`` arguments. They are
+    run once in a template virtualenv under ``.nox-template/<python>``, whose
+    ``site-packages`` is then added to the session's virtualenv through a
+    ``.pth`` file instead of resolving the same dependencies again for every
+    session. Nothing is copied, so the session keeps its own ``pip`` and
+    ``setuptools`` (which come first on ``sys.path``) and a rebuilt template
+    never leaves stale files behind. The template is rebuilt when one of
+    ``INSTALL_CACHE_INPUTS`` changes.
+
+    Console scripts are not available, so tools must be run as
+    ``python -m <module>``.
+    """
+    location = getattr(session.virtualenv, "location", None)
+    if location is None:
+        for args in installs:
+            cached_install(session, *args)
+        return
+
+    session_purelib = _purelib(session, "python")
+    pth_path = os.path.join(session_purelib, TEMPLATE_PTH_FILE)
+    session_stamp_path = os.path.join(location, TEMPLATE_STAMP_FILE)
+
+    if os.environ.get("NOX_SKIP_INSTALL_CACHE"):
+        if os.path.exists(pth_path):
+            os.remove(pth_path)
+            os.remove(session_stamp_path)
+        for args in installs:
+            cached_install(session, *args)
+        return
+
+    if "PIP_CACHE_DIR" not in os.environ:
+        session.env["PIP_CACHE_DIR"] = PIP_CACHE_DIR
+
+    template = TEMPLATE_DIRECTORY / session.python
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
+    template_python = str(template / bin_dir / "python")
+    stamp = {"installs": [list(args) for args in installs]}
+    stamp["mtime"] = _install_inputs_mtime()
+
+    template_stamp_path = str(template / TEMPLATE_STAMP_FILE)
+    if _load_json(template_stamp_path, None) != stamp:
+        shutil.rmtree(str(template), ignore_errors=True)
+        session.run("python", "-m", "venv", str(template))
+        for args in installs:
+            session.run(template_python, "-m", "pip", "install", *args, external=True)
+        _dump_json(template_stamp_path, stamp)
+
+    if not os.path.exists(pth_path) or _load_json(session_stamp_path, None) != stamp:
+        # NOTE: ``addsitedir`` (rather than a bare path) also processes the
+        #       template's own ``.pth`` files, e.g. the editable install.
+        with open(pth_path, "w") as file_obj:
+            file_obj.write(
+                "import site; site.addsitedir({!r})\n".format(
+                    _purelib(session, template_python)
+                )
+            )
+        _dump_json(session_stamp_path, stamp)
+
+
+def _unit_coverage_args(*packages):
+    """Coverage arguments for ``pytest``, if ``NOX_COVERAGE`` is set.
+
+    Tracing every line slows the tests down noticeably and the data is only
+    consumed by the ``cover`` session, so local runs skip it by default.
+    """
+    if not os.environ.get("NOX_COVERAGE"):
+        return []
+
+    cov_args = ["--cov={}".format(package) for package in packages]
+    # NOTE: We don't require 100% line coverage for unit test runs since
+    #       some have branches that are Py2/Py3 specific.
+    cov_args.extend(
+        [
+            "--cov-append",
+            "--cov-config=.coveragerc",
+            "--cov-report=",
+            "--cov-fail-under=0",
+        ]
+    )
+    return cov_args
+
 
 @nox.session(python=UNIT_TEST_PYTHON_VERSIONS)
 def unit(session):
     """Run the unit test suite."""
 
-    constraints_path = str(
-        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
-    )
+    constraints_path = CONSTRAINTS_TEMPLATE.format(session.python)
 
     # Install all test dependencies, then install this package in-place.
-    session.install("mock", "pytest", "pytest-cov", "pytest-asyncio<=0.14.0", GOOGLE_AUTH)
-    session.install("-e", ".[requests,aiohttp]", "-c", constraints_path)
+    install_from_template(
+        session,
+        UNIT_DEPS + ASYNC_DEPS + ("pytest-xdist", GOOGLE_AUTH),
+        EDITABLE_ALL + ("-c", constraints_path),
+    )
 
-    # Run py.test against the unit tests.
-    # NOTE: We don't require 100% line coverage for unit test runs since
-    #       some have branches that are Py2/Py3 specific.
-    line_coverage = "--cov-fail-under=0"
+    # Run pytest against the unit tests.
+    cov_args = _unit_coverage_args(
+        "google.resumable_media",
+        "google._async_resumable_media",
+        "tests.unit",
+        "tests_async.unit",
+    )
     session.run(
-        "py.test",
-        "--cov=google.resumable_media",
-        "--cov=google._async_resumable_media",
-        "--cov=tests.unit",
-        "--cov=tests_async.unit",
-        "--cov-append",
-        "--cov-config=.coveragerc",
-        "--cov-report=",
-        line_coverage,
-        os.path.join("tests", "unit"),
-        os.path.join("tests_async", "unit"),
-        *session.posargs
+        "python",
+        "-m",
+        "pytest",
+        # Spread test modules across all cores; ``loadfile`` keeps each
+        # module on one worker.
+        "-n",
+        os.environ.get(XDIST_WORKERS_ENV, "auto"),
+        "--dist",
+        "loadfile",
+        *cov_args,
+        UNIT_TESTS,
+        ASYNC_UNIT_TESTS,
+        *session.posargs,
     )
 
 
@@ -67,39 +278,95 @@ def unit(session):
 def unit_2(session):
     """Run the unit test suite."""
 
-    constraints_path = str(
-        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
-    )
+    constraints_path = CONSTRAINTS_TEMPLATE.format(session.python)
 
     # Install all test dependencies, then install this package in-place.
-    session.install("mock", "pytest", "pytest-cov")
-    session.install("-e", ".[requests]", "-c", constraints_path)    
+    cached_install(session, *UNIT_DEPS)
+    cached_install(session, *EDITABLE_REQUESTS, "-c", constraints_path)
 
-    # Run py.test against the unit tests.
-    # NOTE: We don't require 100% line coverage for unit test runs since
-    #       some have branches that are Py2/Py3 specific.
-    line_coverage = "--cov-fail-under=0"
-    session.run(
-        "py.test",
-        "--cov=google.resumable_media",
-        "--cov=tests.unit",
-        "--cov-append",
-        "--cov-config=.coveragerc",
-        "--cov-report=",
-        line_coverage,
-        os.path.join("tests", "unit"),
-        *session.posargs
+    # Run pytest against the unit tests.
+    cov_args = _unit_coverage_args("google.resumable_media", "tests.unit")
+    session.run("python", "-m", "pytest", *cov_args, UNIT_TESTS, *session.posargs)
+
+
+@nox.session(python=False)
+def parallel(session):
+    """Run the unit test matrix concurrently, one ``nox`` process per session.
+
+    Output of each child session is written to ``.nox/logs/<session>.log``.
+    Set ``NOX_SERIAL=1`` to run the sessions one after another instead, e.g.
+    to rule out races between concurrent ``pip`` processes.
+
+    Each child runs ``pytest`` with a single xdist worker. With
+    ``NOX_COVERAGE`` set, each child also writes its own
+    ``.coverage.<session>`` file, and these files are combined into
+    ``.coverage`` for the ``cover`` session afterwards.
+    """
+    import concurrent.futures
+    import subprocess
+
+    names = ["unit-{}".format(version) for version in UNIT_TEST_PYTHON_VERSIONS]
+    names.extend(
+        "unit_2-{}".format(version) for version in UNIT_TEST_SYNC_PYTHON_VERSIONS
     )
+    log_dir = os.path.join(".nox", "logs")
+    os.makedirs(log_dir, exist_ok=True)
+
+    coverage = bool(os.environ.get("NOX_COVERAGE"))
+
+    def coverage_file(name):
+        return str(CURRENT_DIRECTORY / ".coverage.{}".format(name))
+
+    def run_one(name):
+        env = dict(os.environ)
+        env[XDIST_WORKERS_ENV] = "1"
+        if coverage:
+            # NOTE: Concurrent ``--cov-append`` runs into one data file would
+            #       lose data, so every child gets its own.
+            env["COVERAGE_FILE"] = coverage_file(name)
+        log_path = os.path.join(log_dir, "{}.log".format(name))
+        with open(log_path, "w") as log_file:
+            result = subprocess.run(
+                [sys.executable, "-m", "nox", "-r", "--no-color", "-s", name]
+                + ["--"]
+                + session.posargs,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                env=env,
+            )
+        return name, log_path, result.returncode
+
+    max_workers = 1 if os.environ.get("NOX_SERIAL") else len(names)
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(run_one, names))
+
+    failed = []
+    for name, log_path, returncode in results:
+        session.log("{}: exit code {} (see {})".format(name, returncode, log_path))
+        if returncode != 0:
+            failed.append(name)
+
+    if coverage:
+        data_files = [
+            coverage_file(name) for name in names if os.path.exists(coverage_file(name))
+        ]
+        python = _unit_virtualenv_python()
+        if data_files and python is not None:
+            session.run(python, "-m", "coverage", "combine", "--append", *data_files)
+
+    if failed:
+        session.error("Failed sessions: {}".format(", ".join(failed)))
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def docs(session):
     """Build the docs for this library."""
 
-    session.install("-e", ".")
-    session.install("sphinx==4.0.1", "alabaster", "recommonmark")
+    cached_install(session, *BUILD_DEPS)
+    cached_install(session, *EDITABLE)
+    cached_install(session, "-c", DOCS_CONSTRAINTS, *DOCS_DEPS)
 
-    shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
+    shutil.rmtree(DOCS_BUILD, ignore_errors=True)
     session.run(
         "sphinx-build",
         "-W",  # warnings as errors
@@ -108,19 +375,23 @@ def docs(session):
         "-b",
         "html",
         "-d",
-        os.path.join("docs", "_build", "doctrees", ""),
-        os.path.join("docs", ""),
-        os.path.join("docs", "_build", "html", ""),
+        os.path.join(DOCS_BUILD, "doctrees", ""),
+        DOCS_SOURCE,
+        os.path.join(DOCS_BUILD, "html", ""),
     )
 
+
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def docfx(session):
     """Build the docfx yaml files for this library."""
 
-    session.install("-e", ".")
-    session.install("sphinx==4.0.1", "alabaster", "recommonmark", "gcp-sphinx-docfx-yaml==0.2.0")
+    cached_install(session, *BUILD_DEPS)
+    cached_install(session, *EDITABLE)
+    cached_install(
+        session, "-c", DOCS_CONSTRAINTS, *DOCS_DEPS, "gcp-sphinx-docfx-yaml==0.2.0"
+    )
 
-    shutil.rmtree(os.path.join("docs", "_build"), ignore_errors=True)
+    shutil.rmtree(DOCS_BUILD, ignore_errors=True)
     session.run(
         "sphinx-build",
         "-T",  # show full traceback on exception
@@ -140,20 +411,25 @@ def docfx(session):
         "-b",
         "html",
         "-d",
-        os.path.join("docs", "_build", "doctrees", ""),
-        os.path.join("docs", ""),
-        os.path.join("docs", "_build", "html", ""),
+        os.path.join(DOCS_BUILD, "doctrees", ""),
+        DOCS_SOURCE,
+        os.path.join(DOCS_BUILD, "html", ""),
     )
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def doctest(session):
     """Run the doctests."""
-    session.install("-e", ".[requests]")
-    session.install("sphinx", "alabaster", "recommonmark")
-    session.install(
-        "sphinx",
-        "sphinx_rtd_theme",
+    cached_install(session, *BUILD_DEPS)
+    cached_install(session, *EDITABLE_REQUESTS)
+    # NOTE: The doctest builder never renders a theme, so ``sphinx_rtd_theme``
+    #       is not needed; ``alabaster`` comes along with ``DOCS_DEPS`` since
+    #       ``docs/conf.py`` configures it.
+    cached_install(
+        session,
+        "-c",
+        DOCS_CONSTRAINTS,
+        *DOCS_DEPS,
         "sphinx-docstring-typing >= 0.0.3",
         "mock",
         GOOGLE_AUTH,
@@ -166,70 +442,42 @@ def doctest(session):
         "-b",
         "doctest",
         "-d",
-        os.path.join("docs", "_build", "doctrees"),
-        os.path.join("docs", ""),
-        os.path.join("docs", "_build", "doctest"),
+        os.path.join(DOCS_BUILD, "doctrees"),
+        DOCS_SOURCE,
+        os.path.join(DOCS_BUILD, "doctest"),
     )
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def lint(session):
-    """Run flake8.
+    """Run flake8 and black via ``pre-commit``.
 
     Returns a failure if flake8 finds linting errors or sufficiently
-    serious code quality issues.
+    serious code quality issues, or if black reformats any file. Hook ids
+    can be passed as positional arguments to run only those hooks, e.g.
+    ``nox -s lint -- black`` to apply black's formatting.
     """
-    session.install("flake8", BLACK_VERSION)
-    session.install("-e", ".")
+    cached_install(session, "pre-commit")
     session.run(
-        "flake8",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
-    )
-    session.run(
-        "black",
-        "--check",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
+        "pre-commit", "run", *session.posargs, "--all-files", "--show-diff-on-failure"
     )
 
 
 @nox.session(python=DEFAULT_PYTHON_VERSION)
 def lint_setup_py(session):
     """Verify that setup.py is valid (including RST check)."""
-    session.install("docutils", "Pygments")
+    cached_install(session, "docutils", "Pygments")
     session.run("python", "setup.py", "check", "--restructuredtext", "--strict")
 
 
-@nox.session(python=DEFAULT_PYTHON_VERSION)
-def blacken(session):
-    session.install(BLACK_VERSION)
-    session.run(
-        "black",
-        os.path.join("google", "resumable_media"),
-        "tests",
-        os.path.join("google", "_async_resumable_media"),
-        "tests_async",
-    )
-
-
 @nox.session(python=SYSTEM_TEST_PYTHON_VERSIONS)
 def system(session):
     """Run the system test suite."""
 
-    constraints_path = str(
-        CURRENT_DIRECTORY / "testing" / f"constraints-{session.python}.txt"
-    )
+    constraints_path = CONSTRAINTS_TEMPLATE.format(session.python)
 
     # Environment check: environment variables are set.
-    missing = []
-    for env_var in SYSTEM_TEST_ENV_VARS:
-        if env_var not in os.environ:
-            missing.append(env_var)
+    missing = sorted(set(SYSTEM_TEST_ENV_VARS).difference(os.environ))
 
     # Only run system tests if the environment variables are set.
     if missing:
@@ -239,27 +487,55 @@ def system(session):
 
     # Install all test dependencies, then install this package into the
     # virtualenv's dist-packages.
-    session.install("mock", "pytest", GOOGLE_AUTH, "google-cloud-testutils")
-    session.install("-e", ".[requests,aiohttp]", "-c", constraints_path)
+    cached_install(session, *SYSTEM_DEPS)
+    cached_install(session, *EDITABLE_ALL, "-c", constraints_path)
 
-    # Run py.test against the async system tests.
+    # Run pytest against the async system tests.
     if session.python.startswith("3"):
-        session.install("pytest-asyncio<=0.14.0")
+        cached_install(session, *ASYNC_DEPS)
         session.run(
-            "py.test", "-s", os.path.join("tests_async", "system"), *session.posargs
+            "python", "-m", "pytest", "-s", ASYNC_SYSTEM_TESTS, *session.posargs
         )
 
-    # Run py.test against the system tests.
-    session.run("py.test", "-s", os.path.join("tests", "system"), *session.posargs)
+    # Run pytest against the system tests.
+    session.run("python", "-m", "pytest", "-s", SYSTEM_TESTS, *session.posargs)
 
 
-@nox.session(python=DEFAULT_PYTHON_VERSION)
+def _unit_virtualenv_python():
+    """Find the interpreter of an existing ``unit`` virtualenv.
+
+    Prefers the ``DEFAULT_PYTHON_VERSION`` session and falls back to any
+    other ``unit`` session, since all of them have ``coverage`` installed
+    (via ``pytest-cov``).
+    """
+    bin_dir = "Scripts" if os.name == "nt" else "bin"
+    preferred = "unit-{}".format(DEFAULT_PYTHON_VERSION.replace(".", "-"))
+    candidates = sorted(glob.glob(os.path.join(".nox", "unit-*")))
+    candidates.sort(key=lambda path: os.path.basename(path) != preferred)
+    for venv in candidates:
+        python = os.path.join(venv, bin_dir, "python")
+        if os.path.exists(python) or os.path.exists(python + ".exe"):
+            return python
+
+    return None
+
+
+@nox.session(python=False)
 def cover(session):
     """Run the final coverage report.
 
     This outputs the coverage report aggregating coverage from the unit
     test runs (not system test runs), and then erases coverage data.
+    The unit sessions only collect coverage when ``NOX_COVERAGE`` is set.
+
+    Rather than building a virtualenv of its own just to install
+    ``coverage``, this reuses the one left behind by a ``unit`` session.
     """
-    session.install("coverage", "pytest-cov")
-    session.run("coverage", "report", "--show-missing", "--fail-under=100")
-    session.run("coverage", "erase")
+    python = _unit_virtualenv_python()
+    if python is None:
+        session.error("No unit session virtualenv found; run `nox -s unit` first.")
+
+    session.run(
+        python, "-m", "coverage", "report", "--show-missing", "--fail-under=100"
+    )
+    session.run(python, "-m", "coverage", "erase")
@@ -21,4 +21,5 @@ s.replace(
     r'value: "docs-staging-v2-staging"'
 )
 
-s.shell.run(["nox", "-s", "blacken"], hide_output=False)
+# The black hook exits non-zero whenever it reformats a file.
+s.shell.run(["nox", "-s", "lint", "--", "black"], hide_output=False, check=False)
@@ -29,6 +29,21 @@ EXAMPLE_URL = (
     u"{BUCKET}/o/{OBJECT}?alt=media"
 )
 EXPECTED_TIMEOUT = (61, 60)
+# Payload (and its checksums) used by the ``_write_to_stream`` tests.
+CHUNKS = (
+    b"first chunk, count starting at 0. ",
+    b"second chunk, or chunk 1, which is better? ",
+    b"ordinals and numerals and stuff.",
+)
+PAYLOAD = b"".join(CHUNKS)
+GOOD_CHECKSUMS = {u"md5": u"fPAJHnnoi/+NadyNxT2c2w==", u"crc32c": u"qmNCyg=="}
+GOOD_HASH_HEADERS = {
+    _helpers._HASH_HEADER: u"crc32c=qmNCyg==,md5=fPAJHnnoi/+NadyNxT2c2w=="
+}
+BAD_CHECKSUM = u"d3JvbmcgbiBtYWRlIHVwIQ=="
+BAD_HASH_HEADERS = {
+    _helpers._HASH_HEADER: u"crc32c={bad},md5={bad}".format(bad=BAD_CHECKSUM)
+}
 
 
 class TestDownload(object):
@@ -57,17 +72,12 @@ class TestDownload(object):
         stream = io.BytesIO()
         download = download_mod.Download(EXAMPLE_URL, stream=stream, checksum=checksum)
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        header_value = u"crc32c=qmNCyg==,md5=fPAJHnnoi/+NadyNxT2c2w=="
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_response(chunks=CHUNKS, headers=GOOD_HASH_HEADERS)
 
         ret_val = download._write_to_stream(response)
         assert ret_val is None
 
-        assert stream.getvalue() == chunk1 + chunk2 + chunk3
+        assert stream.getvalue() == PAYLOAD
 
         # Check mocks.
         response.__enter__.assert_called_once_with()
@@ -81,13 +91,7 @@ class TestDownload(object):
         stream = io.BytesIO()
         download = download_mod.Download(EXAMPLE_URL, stream=stream, checksum=checksum)
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        bad_checksum = u"d3JvbmcgbiBtYWRlIHVwIQ=="
-        header_value = u"crc32c={bad},md5={bad}".format(bad=bad_checksum)
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_response(chunks=CHUNKS, headers=BAD_HASH_HEADERS)
 
         with pytest.raises(common.DataCorruption) as exc_info:
             download._write_to_stream(response)
@@ -97,12 +101,11 @@ class TestDownload(object):
         error = exc_info.value
         assert error.response is response
         assert len(error.args) == 1
-        if checksum == u"md5":
-            good_checksum = u"fPAJHnnoi/+NadyNxT2c2w=="
-        else:
-            good_checksum = u"qmNCyg=="
         msg = download_mod._CHECKSUM_MISMATCH.format(
-            EXAMPLE_URL, bad_checksum, good_checksum, checksum_type=checksum.upper()
+            EXAMPLE_URL,
+            BAD_CHECKSUM,
+            GOOD_CHECKSUMS[checksum],
+            checksum_type=checksum.upper(),
         )
         assert error.args[0] == msg
 
@@ -113,6 +116,20 @@ class TestDownload(object):
             chunk_size=_request_helpers._SINGLE_GET_CHUNK_SIZE, decode_unicode=False
         )
 
+    def test__write_to_stream_without_checksum_leaves_decoder(self):
+        stream = io.BytesIO()
+        download = download_mod.Download(EXAMPLE_URL, stream=stream, checksum=None)
+
+        headers = {u"content-encoding": u"gzip"}
+        response = _mock_response(chunks=CHUNKS, headers=headers)
+
+        ret_val = download._write_to_stream(response)
+        assert ret_val is None
+
+        assert stream.getvalue() == PAYLOAD
+        # No checksum is computed, so the ``urllib3`` decoder is not patched.
+        assert not hasattr(response.raw, u"_decoder")
+
     def test__write_to_stream_with_invalid_checksum_type(self):
         BAD_CHECKSUM_TYPE = "badsum"
 
@@ -121,13 +138,7 @@ class TestDownload(object):
             EXAMPLE_URL, stream=stream, checksum=BAD_CHECKSUM_TYPE
         )
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        bad_checksum = u"d3JvbmcgbiBtYWRlIHVwIQ=="
-        header_value = u"crc32c={bad},md5={bad}".format(bad=bad_checksum)
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_response(chunks=CHUNKS, headers=BAD_HASH_HEADERS)
 
         with pytest.raises(ValueError) as exc_info:
             download._write_to_stream(response)
@@ -304,17 +315,12 @@ class TestRawDownload(object):
             EXAMPLE_URL, stream=stream, checksum=checksum
         )
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        header_value = u"crc32c=qmNCyg==,md5=fPAJHnnoi/+NadyNxT2c2w=="
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_raw_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_raw_response(chunks=CHUNKS, headers=GOOD_HASH_HEADERS)
 
         ret_val = download._write_to_stream(response)
         assert ret_val is None
 
-        assert stream.getvalue() == chunk1 + chunk2 + chunk3
+        assert stream.getvalue() == PAYLOAD
 
         # Check mocks.
         response.__enter__.assert_called_once_with()
@@ -330,13 +336,7 @@ class TestRawDownload(object):
             EXAMPLE_URL, stream=stream, checksum=checksum
         )
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        bad_checksum = u"d3JvbmcgbiBtYWRlIHVwIQ=="
-        header_value = u"crc32c={bad},md5={bad}".format(bad=bad_checksum)
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_raw_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_raw_response(chunks=CHUNKS, headers=BAD_HASH_HEADERS)
 
         with pytest.raises(common.DataCorruption) as exc_info:
             download._write_to_stream(response)
@@ -346,12 +346,11 @@ class TestRawDownload(object):
         error = exc_info.value
         assert error.response is response
         assert len(error.args) == 1
-        if checksum == u"md5":
-            good_checksum = u"fPAJHnnoi/+NadyNxT2c2w=="
-        else:
-            good_checksum = u"qmNCyg=="
         msg = download_mod._CHECKSUM_MISMATCH.format(
-            EXAMPLE_URL, bad_checksum, good_checksum, checksum_type=checksum.upper()
+            EXAMPLE_URL,
+            BAD_CHECKSUM,
+            GOOD_CHECKSUMS[checksum],
+            checksum_type=checksum.upper(),
         )
         assert error.args[0] == msg
 
@@ -370,13 +369,7 @@ class TestRawDownload(object):
             EXAMPLE_URL, stream=stream, checksum=BAD_CHECKSUM_TYPE
         )
 
-        chunk1 = b"first chunk, count starting at 0. "
-        chunk2 = b"second chunk, or chunk 1, which is better? "
-        chunk3 = b"ordinals and numerals and stuff."
-        bad_checksum = u"d3JvbmcgbiBtYWRlIHVwIQ=="
-        header_value = u"crc32c={bad},md5={bad}".format(bad=bad_checksum)
-        headers = {_helpers._HASH_HEADER: header_value}
-        response = _mock_response(chunks=[chunk1, chunk2, chunk3], headers=headers)
+        response = _mock_response(chunks=CHUNKS, headers=BAD_HASH_HEADERS)
 
         with pytest.raises(ValueError) as exc_info:
             download._write_to_stream(response)
@@ -772,13 +765,19 @@ class Test_GzipDecoder(object):
         md5_hash.update.assert_called_once_with(data)
 
 
+def _make_context_manager(response):
+    # i.e. context manager returns ``self``.
+    response.__enter__ = mock.Mock(return_value=response, spec=[])
+    response.__exit__ = mock.Mock(return_value=None, spec=[])
+
+
 def _mock_response(status_code=http_client.OK, chunks=(), headers=None):
     if headers is None:
         headers = {}
 
     if chunks:
         mock_raw = mock.Mock(headers=headers, spec=["headers"])
-        response = mock.MagicMock(
+        response = mock.Mock(
             headers=headers,
             status_code=int(status_code),
             raw=mock_raw,
@@ -791,9 +790,7 @@ def _mock_response(status_code=http_client.OK, chunks=(), headers=None):
                 u"raw",
             ],
         )
-        # i.e. context manager returns ``self``.
-        response.__enter__.return_value = response
-        response.__exit__.return_value = None
+        _make_context_manager(response)
         response.iter_content.return_value = iter(chunks)
         return response
     else:
@@ -810,7 +807,7 @@ def _mock_raw_response(status_code=http_client.OK, chunks=(), headers=None):
 
     mock_raw = mock.Mock(headers=headers, spec=["stream"])
     mock_raw.stream.return_value = iter(chunks)
-    response = mock.MagicMock(
+    response = mock.Mock(
         headers=headers,
         status_code=int(status_code),
         raw=mock_raw,
@@ -823,7 +820,5 @@ def _mock_raw_response(status_code=http_client.OK, chunks=(), headers=None):
             u"raw",
         ],
     )
-    # i.e. context manager returns ``self``.
-    response.__enter__.return_value = response
-    response.__exit__.return_value = None
+    _make_context_manager(response)
     return response
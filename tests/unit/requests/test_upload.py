@@ -39,6 +39,10 @@ BASIC_CONTENT = u"text/plain"
 JSON_TYPE = u"application/json; charset=UTF-8"
 JSON_TYPE_LINE = b"content-type: application/json; charset=UTF-8\r\n"
 EXPECTED_TIMEOUT = (61, 60)
+# NOTE: Pass a copy to ``transmit()``; with a checksum set, the upload adds
+#       the checksum to its ``metadata`` argument in place.
+MULTIPART_METADATA = {u"Hey": u"You", u"Guys": u"90909"}
+MULTIPART_METADATA_BYTES = json.dumps(MULTIPART_METADATA).encode(u"utf-8")
 
 
 class TestSimpleUpload(object):
@@ -85,7 +89,7 @@ class TestMultipartUpload(object):
     @mock.patch(u"google.resumable_media._upload.get_boundary", return_value=b"==4==")
     def test_transmit(self, mock_get_boundary):
         data = b"Mock data here and there."
-        metadata = {u"Hey": u"You", u"Guys": u"90909"}
+        metadata = dict(MULTIPART_METADATA)
         content_type = BASIC_CONTENT
         upload = upload_mod.MultipartUpload(MULTIPART_URL)
 
@@ -94,17 +98,19 @@ class TestMultipartUpload(object):
         assert not upload.finished
         ret_val = upload.transmit(transport, data, metadata, content_type)
         assert ret_val is transport.request.return_value
-        expected_payload = (
-            b"--==4==\r\n"
-            + JSON_TYPE_LINE
-            + b"\r\n"
-            + json.dumps(metadata).encode(u"utf-8")
-            + b"\r\n"
-            + b"--==4==\r\n"
-            b"content-type: text/plain\r\n"
-            b"\r\n"
-            b"Mock data here and there.\r\n"
-            b"--==4==--"
+        expected_payload = b"".join(
+            (
+                b"--==4==\r\n",
+                JSON_TYPE_LINE,
+                b"\r\n",
+                MULTIPART_METADATA_BYTES,
+                b"\r\n",
+                b"--==4==\r\n",
+                b"content-type: text/plain\r\n",
+                b"\r\n",
+                b"Mock data here and there.\r\n",
+                b"--==4==--",
+            )
         )
         multipart_type = b'multipart/related; boundary="==4=="'
         upload_headers = {u"content-type": multipart_type}
@@ -121,7 +127,7 @@ class TestMultipartUpload(object):
     @mock.patch(u"google.resumable_media._upload.get_boundary", return_value=b"==4==")
     def test_transmit_w_custom_timeout(self, mock_get_boundary):
         data = b"Mock data here and there."
-        metadata = {u"Hey": u"You", u"Guys": u"90909"}
+        metadata = dict(MULTIPART_METADATA)
         content_type = BASIC_CONTENT
         upload = upload_mod.MultipartUpload(MULTIPART_URL)
         transport = mock.Mock(spec=["request"])
@@ -134,7 +140,7 @@ class TestMultipartUpload(object):
                 b"--==4==\r\n",
                 JSON_TYPE_LINE,
                 b"\r\n",
-                json.dumps(metadata).encode(u"utf-8"),
+                MULTIPART_METADATA_BYTES,
                 b"\r\n",
                 b"--==4==\r\n",
                 b"content-type: text/plain\r\n",
@@ -15,13 +15,13 @@
 import base64
 import copy
 import hashlib
+from http import client as http_client
 import io
 import os
 
 from google.auth._default_async import default_async
 import google.auth.transport._aiohttp_requests as tr_requests
 import pytest
-from six.moves import http_client
 
 import asyncio
 import multidict
@@ -14,13 +14,13 @@
 
 import base64
 import hashlib
+from http import client as http_client
 import io
 import os
+from urllib import parse as urllib_parse
 
 import mock
 import pytest
-from six.moves import http_client
-from six.moves import urllib_parse
 
 import asyncio
 
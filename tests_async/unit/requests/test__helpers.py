@@ -12,10 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import aiohttp
+from http import client as http_client
 import io
+
+import aiohttp
 import mock
-from six.moves import http_client
 import pytest
 
 from google._async_resumable_media.requests import _request_helpers as _helpers
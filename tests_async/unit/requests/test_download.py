@@ -12,12 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from http import client as http_client
 import io
 
 import aiohttp
 import mock
 import pytest
-from six.moves import http_client
 
 
 from google.resumable_media import common
@@ -45,6 +45,23 @@ class TestDownload(object):
 
         assert stream.getvalue() == chunk1 + chunk2
 
+    @pytest.mark.asyncio
+    async def test__write_to_stream_without_checksum_leaves_decoder(self):
+        stream = io.BytesIO()
+        download = download_mod.Download(
+            sync_test.EXAMPLE_URL, stream=stream, checksum=None
+        )
+
+        headers = {u"content-encoding": u"gzip"}
+        response = _mock_response(chunks=sync_test.CHUNKS, headers=headers)
+
+        ret_val = await download._write_to_stream(response)
+        assert ret_val is None
+
+        assert stream.getvalue() == sync_test.PAYLOAD
+        # No checksum is computed, so the decoder is not patched.
+        assert not hasattr(response, u"_decoder")
+
     @pytest.mark.parametrize("checksum", ["md5", "crc32c", None])
     @pytest.mark.asyncio
     async def test__write_to_stream_with_hash_check_success(self, checksum):
@@ -14,8 +14,8 @@
 
 import aiohttp
 import io
-import json
 import pytest
+import threading
 
 import mock
 
@@ -30,6 +30,8 @@ ONE_MB = sync_test.ONE_MB
 BASIC_CONTENT = sync_test.BASIC_CONTENT
 JSON_TYPE = sync_test.JSON_TYPE
 JSON_TYPE_LINE = sync_test.JSON_TYPE_LINE
+MULTIPART_METADATA = sync_test.MULTIPART_METADATA
+MULTIPART_METADATA_BYTES = sync_test.MULTIPART_METADATA_BYTES
 EXPECTED_TIMEOUT = aiohttp.ClientTimeout(
     total=None, connect=61, sock_read=60, sock_connect=None
 )
@@ -100,7 +102,7 @@ class TestMultipartUpload(object):
     @pytest.mark.asyncio
     async def test_transmit(self, mock_get_boundary):
         data = b"Mock data here and there."
-        metadata = {u"Hey": u"You", u"Guys": u"90909"}
+        metadata = dict(MULTIPART_METADATA)
         content_type = BASIC_CONTENT
         upload = upload_mod.MultipartUpload(MULTIPART_URL)
 
@@ -115,17 +117,19 @@ class TestMultipartUpload(object):
 
         assert ret_val is transport.request.return_value
 
-        expected_payload = (
-            b"--==4==\r\n"
-            + JSON_TYPE_LINE
-            + b"\r\n"
-            + json.dumps(metadata).encode(u"utf-8")
-            + b"\r\n"
-            + b"--==4==\r\n"
-            b"content-type: text/plain\r\n"
-            b"\r\n"
-            b"Mock data here and there.\r\n"
-            b"--==4==--"
+        expected_payload = b"".join(
+            (
+                b"--==4==\r\n",
+                JSON_TYPE_LINE,
+                b"\r\n",
+                MULTIPART_METADATA_BYTES,
+                b"\r\n",
+                b"--==4==\r\n",
+                b"content-type: text/plain\r\n",
+                b"\r\n",
+                b"Mock data here and there.\r\n",
+                b"--==4==--",
+            )
         )
         multipart_type = b'multipart/related; boundary="==4=="'
         upload_headers = {u"content-type": multipart_type}
@@ -145,7 +149,7 @@ class TestMultipartUpload(object):
     @pytest.mark.asyncio
     async def test_transmit_w_custom_timeout(self, mock_get_boundary):
         data = b"Mock data here and there."
-        metadata = {u"Hey": u"You", u"Guys": u"90909"}
+        metadata = dict(MULTIPART_METADATA)
         content_type = BASIC_CONTENT
         upload = upload_mod.MultipartUpload(MULTIPART_URL)
 
@@ -156,17 +160,19 @@ class TestMultipartUpload(object):
 
         await upload.transmit(transport, data, metadata, content_type, timeout=12.6)
 
-        expected_payload = (
-            b"--==4==\r\n"
-            + JSON_TYPE_LINE
-            + b"\r\n"
-            + json.dumps(metadata).encode(u"utf-8")
-            + b"\r\n"
-            + b"--==4==\r\n"
-            b"content-type: text/plain\r\n"
-            b"\r\n"
-            b"Mock data here and there.\r\n"
-            b"--==4==--"
+        expected_payload = b"".join(
+            (
+                b"--==4==\r\n",
+                JSON_TYPE_LINE,
+                b"\r\n",
+                MULTIPART_METADATA_BYTES,
+                b"\r\n",
+                b"--==4==\r\n",
+                b"content-type: text/plain\r\n",
+                b"\r\n",
+                b"Mock data here and there.\r\n",
+                b"--==4==--",
+            )
         )
         multipart_type = b'multipart/related; boundary="==4=="'
         upload_headers = {u"content-type": multipart_type}
@@ -327,6 +333,32 @@ class TestResumableUpload(object):
             timeout=EXPECTED_TIMEOUT,
         )
 
+    @pytest.mark.asyncio
+    async def test_transmit_next_chunk_reads_in_executor(self):
+        data = b"This time the data is official."
+        upload = self._upload_in_flight(data)
+        stream = upload._stream
+        read_threads = []
+
+        def read(size):
+            read_threads.append(threading.current_thread())
+            return stream.read(size)
+
+        upload._stream = mock.Mock(wraps=stream, spec=["read", "seek", "tell"])
+        upload._stream.read.side_effect = read
+        upload._chunk_size = 10
+        response_headers = {u"range": u"bytes=0-9"}
+        transport = self._chunk_mock(
+            _async_resumable_media.PERMANENT_REDIRECT, response_headers
+        )
+
+        await upload.transmit_next_chunk(transport)
+
+        # Make sure the chunk was read off the event loop thread.
+        assert len(read_threads) == 1
+        assert read_threads[0] is not threading.current_thread()
+        assert upload._bytes_uploaded == 10
+
     @pytest.mark.asyncio
     async def test_transmit_next_chunk_w_custom_timeout(self):
         data = b"This time the data is official."
@@ -12,11 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from http import client as http_client
 import io
 
 import mock
 import pytest
-from six.moves import http_client
 
 from google._async_resumable_media import _download
 from google.resumable_media import common